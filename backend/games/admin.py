@@ -21,5 +21,5 @@ class TicTacToeMatchAdmin(admin.ModelAdmin):
 @admin.register(ChessMatch)
 class ChessMatchAdmin(admin.ModelAdmin):
     list_display = ['match', 'current_player', 'move_count']
-    list_filter = ['current_player']
+    list_filter = ['white_to_move']
     readonly_fields = ['board', 'fen']
\ No newline at end of file
@@ -1,114 +1,226 @@
-import copy
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# The eight winning lines as 9-bit masks over flat squares 0..8
+# (bit i = row * 3 + col): rows, columns, diagonals
+LINES = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+FULL_BOARD = 0b111111111
+
+def _build_symmetry_maps():
+    """Build bitmask translation tables for the 8 board symmetries (D4 group)"""
+    def rotate(i):  # 90 degrees clockwise on flat index
+        r, c = divmod(i, 3)
+        return c * 3 + (2 - r)
+
+    def reflect(i):  # mirror columns
+        r, c = divmod(i, 3)
+        return r * 3 + (2 - c)
+
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perm = tuple(rotate(i) for i in perm)
+    perm = tuple(reflect(i) for i in range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perm = tuple(rotate(i) for i in perm)
+
+    maps = []
+    for perm in perms:
+        table = [0] * 512
+        for bits in range(512):
+            transformed = 0
+            rest = bits
+            while rest:
+                bit = rest & -rest
+                transformed |= 1 << perm[bit.bit_length() - 1]
+                rest &= rest - 1
+            table[bits] = transformed
+        maps.append(table)
+    return maps
+
+_SYM_MAPS = _build_symmetry_maps()
+
+def _canonical(ai_bits: int, hum_bits: int) -> Tuple[int, int]:
+    """Map a position to its lexicographically smallest symmetric twin"""
+    best_ai = ai_bits
+    best_hum = hum_bits
+    best_key = (ai_bits << 9) | hum_bits
+    for table in _SYM_MAPS:
+        t_ai = table[ai_bits]
+        t_hum = table[hum_bits]
+        key = (t_ai << 9) | t_hum
+        if key < best_key:
+            best_key = key
+            best_ai = t_ai
+            best_hum = t_hum
+    return best_ai, best_hum
+
+def _check_winner(ai_bits: int, hum_bits: int) -> int:
+    """Return 1 if the AI has a line, -1 if the human has one, 0 otherwise"""
+    for line in LINES:
+        if ai_bits & line == line:
+            return 1
+        if hum_bits & line == line:
+            return -1
+    return 0
+
+def _minimax(ai_bits: int, hum_bits: int, depth: int, is_maximizing: bool) -> int:
+    """Score a position, folding the 8 symmetric variants onto one cache entry
+
+    Position values are orientation-invariant, so the memoized kernel only
+    ever sees canonical positions - roughly an 8x smaller state space
+    """
+    ai_bits, hum_bits = _canonical(ai_bits, hum_bits)
+    return _minimax_kernel(ai_bits, hum_bits, depth, is_maximizing)
+
+@lru_cache(maxsize=None)
+def _minimax_kernel(ai_bits: int, hum_bits: int, depth: int, is_maximizing: bool) -> int:
+    """Minimax kernel over the two occupancy bitmasks
+
+    Memoized on the canonical position - tic-tac-toe has only ~5500
+    reachable states (~700 after symmetry folding), so after warmup every
+    node is a cache hit and alpha-beta pruning is no longer needed
+    """
+    winner = _check_winner(ai_bits, hum_bits)
+
+    # Base cases
+    if winner == 1:
+        return 10 - depth
+    elif winner == -1:
+        return depth - 10
+
+    occupied = ai_bits | hum_bits
+    if occupied == FULL_BOARD:
+        return 0
+
+    empty = FULL_BOARD & ~occupied
+    if is_maximizing:
+        max_score = -100
+        while empty:
+            bit = empty & -empty
+            score = _minimax(ai_bits | bit, hum_bits, depth + 1, False)
+            if score > max_score:
+                max_score = score
+            empty &= empty - 1
+        return max_score
+    else:
+        min_score = 100
+        while empty:
+            bit = empty & -empty
+            score = _minimax(ai_bits, hum_bits | bit, depth + 1, True)
+            if score < min_score:
+                min_score = score
+            empty &= empty - 1
+        return min_score
+
+def _best_move(ai_bits: int, hum_bits: int) -> int:
+    """Return the flat index of the AI's best move, or -1 if the board is full"""
+    best_score = -100
+    best_index = -1
+    explored = set()
+
+    empty = FULL_BOARD & ~(ai_bits | hum_bits)
+    while empty:
+        bit = empty & -empty
+        empty &= empty - 1
+
+        # Skip moves whose resulting position is a symmetric duplicate of
+        # one already tried this ply (e.g. 9 first moves collapse to 3)
+        canonical = _canonical(ai_bits | bit, hum_bits)
+        if canonical in explored:
+            continue
+        explored.add(canonical)
+
+        score = _minimax(ai_bits | bit, hum_bits, 0, False)
+        if score > best_score:
+            best_score = score
+            best_index = bit.bit_length() - 1
+
+    return best_index
+
+# Perfect-play table: (ai_bits, hum_bits) -> best flat index for the AI.
+# Tic-tac-toe is small enough (5478 legal positions) to solve completely
+# at import time, turning get_best_move into a single dict lookup.
+_BEST = {}
+
+def _precompute(ai_bits: int, hum_bits: int, ai_to_move: bool, seen: set) -> None:
+    """Walk every reachable position and record the AI's best move in _BEST"""
+    state = (ai_bits, hum_bits, ai_to_move)
+    if state in seen:
+        return
+    seen.add(state)
+
+    if _check_winner(ai_bits, hum_bits) or (ai_bits | hum_bits) == FULL_BOARD:
+        return
+
+    if ai_to_move:
+        _BEST[(ai_bits, hum_bits)] = _best_move(ai_bits, hum_bits)
+
+    empty = FULL_BOARD & ~(ai_bits | hum_bits)
+    while empty:
+        bit = empty & -empty
+        if ai_to_move:
+            _precompute(ai_bits | bit, hum_bits, False, seen)
+        else:
+            _precompute(ai_bits, hum_bits | bit, True, seen)
+        empty &= empty - 1
+
+# Solve both game starts (AI first and human first) once at import
+_seen: set = set()
+_precompute(0, 0, True, _seen)
+_precompute(0, 0, False, _seen)
+del _seen
 
 class TicTacToeAI:
-    """AI player for Tic Tac Toe using minimax algorithm with alpha-beta pruning"""
-    
+    """AI player for Tic Tac Toe using a precomputed perfect-play table"""
+
     def __init__(self, ai_symbol='O', human_symbol='X'):
         self.ai_symbol = ai_symbol
         self.human_symbol = human_symbol
-    
-    def get_best_move(self, board: List[List[str]]) -> Tuple[int, int]:
-        """Get the best move for AI using minimax with alpha-beta pruning"""
-        best_score = float('-inf')
-        best_move = None
-        
-        for row in range(3):
-            for col in range(3):
-                if board[row][col] == '':
-                    # Make the move
-                    board[row][col] = self.ai_symbol
-                    
-                    # Calculate score
-                    score = self.minimax(board, 0, False, float('-inf'), float('inf'))
-                    
-                    # Undo the move
-                    board[row][col] = ''
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_move = (row, col)
-        
-        return best_move if best_move else (0, 0)
-    
-    def minimax(self, board: List[List[str]], depth: int, is_maximizing: bool, 
-                alpha: float, beta: float) -> int:
-        """Minimax algorithm with alpha-beta pruning"""
-        winner = self.check_winner(board)
-        
-        # Base cases
-        if winner == self.ai_symbol:
-            return 10 - depth
-        elif winner == self.human_symbol:
-            return depth - 10
-        elif self.is_board_full(board):
-            return 0
-        
-        if is_maximizing:
-            max_score = float('-inf')
-            for row in range(3):
-                for col in range(3):
-                    if board[row][col] == '':
-                        board[row][col] = self.ai_symbol
-                        score = self.minimax(board, depth + 1, False, alpha, beta)
-                        board[row][col] = ''
-                        
-                        max_score = max(score, max_score)
-                        alpha = max(alpha, score)
-                        
-                        if beta <= alpha:
-                            break  # Alpha-beta pruning
-                if beta <= alpha:
-                    break
-            return max_score
-        else:
-            min_score = float('inf')
-            for row in range(3):
-                for col in range(3):
-                    if board[row][col] == '':
-                        board[row][col] = self.human_symbol
-                        score = self.minimax(board, depth + 1, True, alpha, beta)
-                        board[row][col] = ''
-                        
-                        min_score = min(score, min_score)
-                        beta = min(beta, score)
-                        
-                        if beta <= alpha:
-                            break  # Alpha-beta pruning
-                if beta <= alpha:
-                    break
-            return min_score
-    
-    def check_winner(self, board: List[List[str]]) -> Optional[str]:
-        """Check if there's a winner on the board"""
-        # Check rows
+
+    def encode_board(self, board: List[List[str]]) -> Tuple[int, int]:
+        """Encode the 3x3 string grid as (ai_bits, human_bits) occupancy masks"""
+        ai_bits = 0
+        hum_bits = 0
+        index = 0
         for row in board:
-            if row[0] == row[1] == row[2] != '':
-                return row[0]
-        
-        # Check columns
-        for col in range(3):
-            if board[0][col] == board[1][col] == board[2][col] != '':
-                return board[0][col]
-        
-        # Check diagonals
-        if board[0][0] == board[1][1] == board[2][2] != '':
-            return board[0][0]
-        if board[0][2] == board[1][1] == board[2][0] != '':
-            return board[0][2]
-        
-        return None
-    
-    def is_board_full(self, board: List[List[str]]) -> bool:
+            for cell in row:
+                if cell == self.ai_symbol:
+                    ai_bits |= 1 << index
+                elif cell == self.human_symbol:
+                    hum_bits |= 1 << index
+                index += 1
+        return ai_bits, hum_bits
+
+    def get_best_move(self, board: List[List[str]]) -> Tuple[int, int]:
+        """Get the best move for AI from the solved game tree"""
+        ai_bits, hum_bits = self.encode_board(board)
+        best_index = _BEST.get((ai_bits, hum_bits), -1)
+        if best_index < 0:
+            # Position not reachable in normal play - solve it on the fly
+            best_index = _best_move(ai_bits, hum_bits)
+        return divmod(best_index, 3) if best_index >= 0 else (0, 0)
+
+    def minimax(self, ai_bits: int, hum_bits: int, depth: int, is_maximizing: bool) -> int:
+        """Minimax over the occupancy bitmasks (memoized at module level)"""
+        return _minimax(ai_bits, hum_bits, depth, is_maximizing)
+
+    def check_winner(self, ai_bits: int, hum_bits: int) -> Optional[int]:
+        """Check if there's a winner on the board (1=AI won, -1=human won, None otherwise)"""
+        winner = _check_winner(ai_bits, hum_bits)
+        return winner if winner else None
+
+    def is_board_full(self, ai_bits: int, hum_bits: int) -> bool:
         """Check if the board is full"""
-        return all(board[i][j] != '' for i in range(3) for j in range(3))
-    
-    def evaluate_position(self, board: List[List[str]]) -> int:
+        return (ai_bits | hum_bits) == FULL_BOARD
+
+    def evaluate_position(self, ai_bits: int, hum_bits: int) -> int:
         """Evaluate the current board position"""
-        winner = self.check_winner(board)
-        if winner == self.ai_symbol:
-            return 1
-        elif winner == self.human_symbol:
-            return -1
-        else:
-            return 0
\ No newline at end of file
+        return _check_winner(ai_bits, hum_bits)
@@ -1,6 +1,36 @@
+from copy import copy
+
 from django.apps import AppConfig
 
 
 class GamesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'games'
\ No newline at end of file
+    name = 'games'
+
+    def ready(self):
+        _cache_serializer_fields()
+
+
+def _cache_serializer_fields():
+    """Cache ModelSerializer field construction per serializer class
+
+    DRF rebuilds the whole field dict - model introspection plus a
+    deepcopy of every declared Field - each time a serializer is
+    instantiated, which happens on every request in the views. The
+    field definitions never change at runtime, so build them once per
+    class and hand each instance shallow copies (copies are still
+    needed because bind() writes field_name/parent onto the Field).
+    """
+    from rest_framework.serializers import ModelSerializer
+
+    original_get_fields = ModelSerializer.get_fields
+    fields_by_class = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        fields = fields_by_class.get(cls)
+        if fields is None:
+            fields = fields_by_class[cls] = original_get_fields(self)
+        return {name: copy(field) for name, field in fields.items()}
+
+    ModelSerializer.get_fields = get_fields
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 07:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0003_rename_halfmove_clock_chessmatch_move_count_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='chessmatch',
+            name='board',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-30 07:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0004_remove_chessmatch_board'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='match',
+            name='started_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='match',
+            name='status',
+            field=models.CharField(choices=[('waiting', 'Waiting for Players'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('abandoned', 'Abandoned')], db_index=True, default='waiting', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['player', '-started_at'], name='games_match_player__9cce0f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['status', 'game'], name='games_match_status_56c043_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-30 07:59
+
+from django.db import migrations, models
+
+
+def copy_turn(apps, schema_editor):
+    """Carry the old string column over before it is dropped"""
+    ChessMatch = apps.get_model('games', 'ChessMatch')
+    ChessMatch.objects.filter(current_player='black').update(white_to_move=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0005_alter_match_started_at_alter_match_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chessmatch',
+            name='white_to_move',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.RunPython(copy_turn, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='chessmatch',
+            name='current_player',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-30 08:00
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0006_remove_chessmatch_current_player_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='match',
+            options={'base_manager_name': 'objects_raw', 'ordering': ['-started_at']},
+        ),
+        migrations.AlterModelManagers(
+            name='match',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('objects_raw', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
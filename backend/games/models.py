@@ -2,6 +2,10 @@ from django.db import models
 from django.contrib.auth import get_user_model
 import json
 
+import chess
+
+from .optimized_chess_ai import board_to_fen
+
 User = get_user_model()
 
 class Game(models.Model):
@@ -22,6 +26,13 @@ class Game(models.Model):
     def __str__(self):
         return self.name
 
+class MatchManager(models.Manager):
+    """Default manager that eagerly joins the FKs __str__ and the
+    serializers touch, so listing matches is one query instead of 2N+1"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('game', 'player')
+
 class Match(models.Model):
     """Model for individual game matches"""
     MATCH_STATUS = [
@@ -40,31 +51,61 @@ class Match(models.Model):
     game = models.ForeignKey(Game, on_delete=models.CASCADE)
     player = models.ForeignKey(User, on_delete=models.CASCADE, related_name='matches')
     opponent = models.CharField(max_length=50, default='AI')  # For AI games
-    status = models.CharField(max_length=20, choices=MATCH_STATUS, default='waiting')
+    status = models.CharField(max_length=20, choices=MATCH_STATUS, default='waiting', db_index=True)
     result = models.CharField(max_length=10, choices=RESULT_CHOICES, blank=True, null=True)
     
     # Game state stored as JSON
     game_state = models.JSONField(default=dict)
     moves_history = models.JSONField(default=list)
     
-    started_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(auto_now_add=True, db_index=True)
     completed_at = models.DateTimeField(blank=True, null=True)
-    
+
+    objects = MatchManager()
+    # Write paths that never touch game/player can skip the join
+    objects_raw = models.Manager()
+
     class Meta:
         ordering = ['-started_at']
+        # Keep internal related-object access on the plain manager
+        base_manager_name = 'objects_raw'
+        indexes = [
+            # dashboard/history: filter by player, newest first
+            models.Index(fields=['player', '-started_at']),
+            # active-match style lookups
+            models.Index(fields=['status', 'game']),
+        ]
     
     def __str__(self):
         return f"{self.player.username} vs {self.opponent} - {self.game.name}"
     
     def add_move(self, move_data):
-        """Add a move to the match history"""
+        """Append a move to the in-memory history (persist with flush_moves)"""
         self.moves_history.append(move_data)
-        self.save()
+
+    def flush_moves(self):
+        """Persist accumulated history in a single narrow UPDATE
+
+        Callers batch add_move() per request and flush once, instead of
+        rewriting the whole JSON blob row after every half-move
+        """
+        self.save(update_fields=['moves_history'])
 
 def get_default_board():
     """Return default empty 3x3 board"""
     return [['' for _ in range(3)] for _ in range(3)]
 
+# The eight winning lines as flat indices (row * 3 + col)
+TTT_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# python-chess square index -> our (row, col), precomputed for the move
+# conversion loops; a single tuple subscript replaces the shift/mask pair
+SQ_TO_RC = tuple((7 - (sq >> 3), sq & 7) for sq in range(64))
+
 class TicTacToeMatch(models.Model):
     """Specific model for Tic Tac Toe matches with game logic"""
     match = models.OneToOneField(Match, on_delete=models.CASCADE)
@@ -74,38 +115,34 @@ class TicTacToeMatch(models.Model):
     def __str__(self):
         return f"TicTacToe: {self.match}"
     
-    def make_move(self, row, col, player):
-        """Make a move on the board"""
+    def make_move(self, row, col, player, commit=True):
+        """Make a move on the board
+
+        commit=False applies the move in memory only, so a caller playing
+        both halves of a turn can persist them with a single save
+        """
         if self.board[row][col] == '':
             self.board[row][col] = player
             self.current_player = 'O' if player == 'X' else 'X'
-            self.save()
+            if commit:
+                self.save(update_fields=['board', 'current_player'])
             return True
         return False
     
     def check_winner(self):
         """Check if there's a winner"""
-        # Check rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] != '':
-                return row[0]
-        
-        # Check columns
-        for col in range(3):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] != '':
-                return self.board[0][col]
-        
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != '':
-            return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != '':
-            return self.board[0][2]
-        
+        # One pass over the precomputed lines on a flattened board beats
+        # the separate row/column/diagonal loops with nested indexing
+        board = self.board
+        flat = board[0] + board[1] + board[2]
+        for a, b, c in TTT_LINES:
+            if flat[a] and flat[a] == flat[b] == flat[c]:
+                return flat[a]
         return None
     
     def is_board_full(self):
         """Check if the board is full"""
-        return all(self.board[i][j] != '' for i in range(3) for j in range(3))
+        return not any('' in row for row in self.board)
     
     def is_game_over(self):
         """Check if the game is over"""
@@ -113,12 +150,8 @@ class TicTacToeMatch(models.Model):
     
     def get_available_moves(self):
         """Get list of available moves"""
-        moves = []
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] == '':
-                    moves.append((i, j))
-        return moves
+        return [(i, j) for i, row in enumerate(self.board)
+                for j, cell in enumerate(row) if cell == '']
 
 def get_default_chess_board():
     """Return default chess starting position"""
@@ -140,56 +173,100 @@ class ChessMatch(models.Model):
     # Use FEN for efficient chess operations (much faster than JSON board)
     fen = models.TextField(default='rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
     
-    # Keep board representation for backward compatibility with frontend
-    board = models.JSONField(default=get_default_chess_board)
-    current_player = models.CharField(max_length=5, default='white')  # 'white' or 'black'
-    
+    # Side to move as a boolean (True = white), matching chess.Board.turn;
+    # one CPU-level compare instead of a string compare in the hot paths
+    white_to_move = models.BooleanField(default=True)
+
     # Simplified game state - most info now in FEN
     move_count = models.IntegerField(default=0)
-    
+
     def __str__(self):
         return f"Chess: {self.match}"
-    
+
+    @property
+    def current_player(self):
+        """'white' or 'black' for the frontend, derived from white_to_move"""
+        return 'white' if self.white_to_move else 'black'
+
     def save(self, *args, **kwargs):
-        """Auto-sync board array from FEN when saving"""
-        self.sync_board_from_fen()
+        """Keep white_to_move in sync with the FEN side to move"""
+        self.white_to_move = self.fen.split(' ', 2)[1] == 'w'
+        # A narrow update that touches the FEN must also carry the derived
+        # turn column, or the sync above would never hit the DB
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'fen' in update_fields \
+                and 'white_to_move' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'white_to_move']
         super().save(*args, **kwargs)
     
-    def sync_board_from_fen(self):
-        """Update board array from FEN for frontend compatibility"""
-        import chess
-        board = chess.Board(self.fen)
-        
-        # Clear board array
-        self.board = [['' for _ in range(8)] for _ in range(8)]
-        
-        # Fill from chess.Board
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                row = 7 - (square // 8)  # Convert chess.py coordinates to our system
-                col = square % 8
-                self.board[row][col] = str(piece)
-        
-        # Update current player from FEN
-        self.current_player = 'white' if board.turn else 'black'
-    
+    def _get_board(self):
+        """Return a parsed chess.Board for the current FEN, cached per instance
+
+        The cache remembers the FEN it was built from, so any assignment to
+        self.fen naturally invalidates it on the next call. Callers that
+        mutate the board must work on a copy (see make_move_fast)
+        """
+        cached = getattr(self, '_board_cache', None)
+        if cached is None or cached[0] != self.fen:
+            cached = (self.fen, chess.Board(self.fen))
+            self._board_cache = cached
+        return cached[1]
+
+    @property
+    def board(self):
+        """8x8 board array for the frontend, derived from the FEN on demand
+
+        FEN is the authoritative state; deriving the array on read removes
+        the JSON column write (and chess.Board construction) every save
+        used to pay, even when nothing consulted the board
+        """
+        # The FEN placement field already lists ranks 8..1 in our row
+        # order, so the array comes straight from the cached square bytes
+        # without constructing a chess.Board at all
+        squares = self._get_squares()
+        return [[chr(value) if value != 32 else '' for value in squares[row * 8:row * 8 + 8]]
+                for row in range(8)]
+
+
     def sync_fen_from_board(self):
         """Update FEN from board array (for backward compatibility)"""
-        from .optimized_chess_ai import OptimizedChessAI
-        ai = OptimizedChessAI()
-        self.fen = ai.board_to_fen(self.board)
+        self.fen = board_to_fen(self.board)
     
+    def _get_squares(self):
+        """Return the position as a flat 64-byte array indexed row * 8 + col
+
+        Each byte is the ASCII piece letter, space for empty. Parsed in one
+        pass over the FEN placement field and cached per instance like
+        _get_board, so piece lookups cost a single C-level subscript
+        instead of two nested-list dispatches
+        """
+        cached = getattr(self, '_squares_cache', None)
+        if cached is None or cached[0] != self.fen:
+            squares = bytearray(b' ' * 64)
+            index = 0
+            for char in self.fen.split(' ', 1)[0]:
+                if char == '/':
+                    continue
+                elif char.isdigit():
+                    index += int(char)
+                else:
+                    squares[index] = ord(char)
+                    index += 1
+            cached = (self.fen, squares)
+            self._squares_cache = cached
+        return cached[1]
+
     def get_piece_at(self, row, col):
         """Get piece at given position"""
         if 0 <= row < 8 and 0 <= col < 8:
-            return self.board[row][col]
+            value = self._get_squares()[row * 8 + col]
+            return chr(value) if value != 32 else ''
         return None
-    
+
     def set_piece_at(self, row, col, piece):
-        """Set piece at given position"""
+        """Set piece at given position (transient - FEN remains authoritative)"""
         if 0 <= row < 8 and 0 <= col < 8:
-            self.board[row][col] = piece
+            self._get_squares()[row * 8 + col] = ord(piece) if piece else 32
     
     def is_white_piece(self, piece):
         """Check if piece belongs to white player"""
@@ -214,252 +291,82 @@ class ChessMatch(models.Model):
             return self.is_white_piece(piece)
     
     def get_piece_moves(self, row, col):
-        """Get all possible moves for piece at given position"""
-        piece = self.get_piece_at(row, col)
-        if not piece:
+        """Get all legal moves for piece at given position"""
+        board = self._get_board()
+        from_square = chess.square(col, 7 - row)
+
+        if board.piece_at(from_square) is None:
             return []
-        
-        piece_type = piece.lower()
-        
-        if piece_type == 'p':
-            return self.get_pawn_moves(row, col)
-        elif piece_type == 'r':
-            return self.get_rook_moves(row, col)
-        elif piece_type == 'n':
-            return self.get_knight_moves(row, col)
-        elif piece_type == 'b':
-            return self.get_bishop_moves(row, col)
-        elif piece_type == 'q':
-            return self.get_queen_moves(row, col)
-        elif piece_type == 'k':
-            return self.get_king_moves(row, col)
-        
-        return []
-    
-    def get_pawn_moves(self, row, col):
-        """Get pawn moves"""
-        moves = []
-        piece = self.get_piece_at(row, col)
-        is_white = self.is_white_piece(piece)
-        
-        direction = -1 if is_white else 1  # White moves up (-1), black moves down (+1)
-        start_row = 6 if is_white else 1
-        
-        # Forward move
-        new_row = row + direction
-        if 0 <= new_row < 8 and not self.get_piece_at(new_row, col):
-            moves.append((new_row, col))
-            
-            # Double forward move from starting position
-            if row == start_row:
-                new_row = row + 2 * direction
-                if 0 <= new_row < 8 and not self.get_piece_at(new_row, col):
-                    moves.append((new_row, col))
-        
-        # Capture moves
-        for dc in [-1, 1]:
-            new_row, new_col = row + direction, col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target_piece = self.get_piece_at(new_row, new_col)
-                if target_piece and self.is_enemy_piece(target_piece, 'white' if is_white else 'black'):
-                    moves.append((new_row, new_col))
-        
-        return moves
-    
-    def get_rook_moves(self, row, col):
-        """Get rook moves (horizontal and vertical)"""
-        moves = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row, new_col = row + dr * i, col + dc * i
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                
-                target_piece = self.get_piece_at(new_row, new_col)
-                if not target_piece:
-                    moves.append((new_row, new_col))
-                elif self.is_enemy_piece(target_piece, self.current_player):
-                    moves.append((new_row, new_col))
-                    break
-                else:
-                    break
-        
-        return moves
-    
-    def get_knight_moves(self, row, col):
-        """Get knight moves (L-shaped)"""
-        moves = []
-        knight_moves = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), 
-                       (1, -2), (1, 2), (2, -1), (2, 1)]
-        
-        for dr, dc in knight_moves:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target_piece = self.get_piece_at(new_row, new_col)
-                if not target_piece or self.is_enemy_piece(target_piece, self.current_player):
-                    moves.append((new_row, new_col))
-        
-        return moves
-    
-    def get_bishop_moves(self, row, col):
-        """Get bishop moves (diagonal)"""
-        moves = []
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]  # Diagonals
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row, new_col = row + dr * i, col + dc * i
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                
-                target_piece = self.get_piece_at(new_row, new_col)
-                if not target_piece:
-                    moves.append((new_row, new_col))
-                elif self.is_enemy_piece(target_piece, self.current_player):
-                    moves.append((new_row, new_col))
-                    break
-                else:
-                    break
-        
-        return moves
-    
-    def get_queen_moves(self, row, col):
-        """Get queen moves (rook + bishop)"""
-        return self.get_rook_moves(row, col) + self.get_bishop_moves(row, col)
-    
-    def get_king_moves(self, row, col):
-        """Get king moves (one square in any direction)"""
-        moves = []
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), 
-                     (0, 1), (1, -1), (1, 0), (1, 1)]
-        
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target_piece = self.get_piece_at(new_row, new_col)
-                if not target_piece or self.is_enemy_piece(target_piece, self.current_player):
-                    moves.append((new_row, new_col))
-        
-        return moves
-    
+
+        # from_mask restricts generation to this square inside the C
+        # generator instead of filtering the full move list in Python
+        return [SQ_TO_RC[move.to_square]
+                for move in board.generate_legal_moves(from_mask=chess.BB_SQUARES[from_square])]
+
     def is_square_attacked(self, row, col, by_player):
         """Check if a square is attacked by the given player"""
-        for r in range(8):
-            for c in range(8):
-                piece = self.get_piece_at(r, c)
-                if piece and self.is_friendly_piece(piece, by_player):
-                    # Temporarily switch player to get correct moves
-                    original_player = self.current_player
-                    self.current_player = by_player
-                    moves = self.get_piece_moves(r, c)
-                    self.current_player = original_player
-                    
-                    if (row, col) in moves:
-                        return True
-        return False
-    
+        board = self._get_board()
+        color = chess.WHITE if by_player == 'white' else chess.BLACK
+        return board.is_attacked_by(color, chess.square(col, 7 - row))
+
     def is_in_check(self, player):
         """Check if player's king is in check"""
-        # Find king position
-        king_piece = 'K' if player == 'white' else 'k'
-        king_pos = None
-        
-        for r in range(8):
-            for c in range(8):
-                if self.get_piece_at(r, c) == king_piece:
-                    king_pos = (r, c)
-                    break
-            if king_pos:
-                break
-        
-        if not king_pos:
+        board = self._get_board()
+        color = chess.WHITE if player == 'white' else chess.BLACK
+        king_square = board.king(color)
+
+        if king_square is None:
             return False
-        
-        opponent = 'black' if player == 'white' else 'white'
-        return self.is_square_attacked(king_pos[0], king_pos[1], opponent)
-    
+
+        return board.is_attacked_by(not color, king_square)
+
     def make_move(self, from_row, from_col, to_row, to_col):
         """Make a move and return if successful"""
-        piece = self.get_piece_at(from_row, from_col)
-        if not piece or not self.is_friendly_piece(piece, self.current_player):
-            return False
-        
-        # Check if move is valid
-        valid_moves = self.get_piece_moves(from_row, from_col)
-        if (to_row, to_col) not in valid_moves:
-            return False
-        
-        # Make the move
-        captured_piece = self.get_piece_at(to_row, to_col)
-        self.set_piece_at(to_row, to_col, piece)
-        self.set_piece_at(from_row, from_col, '')
-        
-        # Handle pawn promotion (auto-promote to Queen)
-        if piece.lower() == 'p':  # It's a pawn
-            if (piece == 'P' and to_row == 0) or (piece == 'p' and to_row == 7):
-                # White pawn reaches row 0, or black pawn reaches row 7
-                promoted_piece = 'Q' if piece == 'P' else 'q'
-                self.set_piece_at(to_row, to_col, promoted_piece)
-                print(f"Pawn promoted to Queen at ({to_row}, {to_col})")
-        
-        # Check if this move puts own king in check (invalid)
-        if self.is_in_check(self.current_player):
-            # Undo move
-            self.set_piece_at(from_row, from_col, piece)
-            self.set_piece_at(to_row, to_col, captured_piece)
+        if not self.make_move_fast(from_row, from_col, to_row, to_col):
             return False
-        
-        # Update game state
-        self.current_player = 'black' if self.current_player == 'white' else 'white'
-        
-        # Update castling rights
-        if piece.lower() == 'k':
-            if self.current_player == 'black':  # White just moved
-                self.white_king_moved = True
-            else:  # Black just moved
-                self.black_king_moved = True
-        
-        self.save()
+
+        self.save(update_fields=['fen', 'move_count', 'white_to_move'])
         return True
-    
+
     def get_all_legal_moves(self, player):
-        """Get all legal moves for a player"""
-        legal_moves = []
-        for r in range(8):
-            for c in range(8):
-                piece = self.get_piece_at(r, c)
-                if piece and self.is_friendly_piece(piece, player):
-                    piece_moves = self.get_piece_moves(r, c)
-                    for to_r, to_c in piece_moves:
-                        # Test if move is legal (doesn't leave king in check)
-                        captured_piece = self.get_piece_at(to_r, to_c)
-                        self.set_piece_at(to_r, to_c, piece)
-                        self.set_piece_at(r, c, '')
-                        
-                        if not self.is_in_check(player):
-                            legal_moves.append(((r, c), (to_r, to_c)))
-                        
-                        # Undo move
-                        self.set_piece_at(r, c, piece)
-                        self.set_piece_at(to_r, to_c, captured_piece)
-        
-        return legal_moves
-    
+        """Get all legal moves for a player as ((from_row, from_col), (to_row, to_col))"""
+        board = self._get_board()
+        color = chess.WHITE if player == 'white' else chess.BLACK
+
+        if board.turn != color:
+            # Don't flip the turn on the cached board - work on a copy
+            board = board.copy(stack=False)
+            board.turn = color
+
+        return [(SQ_TO_RC[move.from_square], SQ_TO_RC[move.to_square])
+                for move in board.generate_legal_moves()]
+
+    def _has_legal_move(self, player):
+        """Whether the player has any legal move, without building the full list"""
+        board = self._get_board()
+        color = chess.WHITE if player == 'white' else chess.BLACK
+
+        if board.turn != color:
+            board = board.copy(stack=False)
+            board.turn = color
+
+        return any(board.generate_legal_moves())
+
     def is_checkmate(self, player):
         """Check if player is in checkmate"""
-        return self.is_in_check(player) and len(self.get_all_legal_moves(player)) == 0
-    
+        return self.is_in_check(player) and not self._has_legal_move(player)
+
     def is_stalemate(self, player):
         """Check if player is in stalemate"""
-        return not self.is_in_check(player) and len(self.get_all_legal_moves(player)) == 0
-    
+        return not self.is_in_check(player) and not self._has_legal_move(player)
+
     def is_game_over(self):
         """Check if game is over"""
-        return (self.is_checkmate('white') or self.is_checkmate('black') or 
-                self.is_stalemate('white') or self.is_stalemate('black'))
-    
+        # Only the side to move can be mated or stalemated, and both cases
+        # reduce to "no legal move" - one short-circuiting generator probe
+        # instead of four checkmate/stalemate scans across both colors
+        return not any(self._get_board().generate_legal_moves())
+
     def get_game_result(self):
         """Get game result"""
         if self.is_checkmate('white'):
@@ -474,24 +381,23 @@ class ChessMatch(models.Model):
     
     def make_move_fast(self, from_row, from_col, to_row, to_col):
         """FAST move using python-chess library - reduces AI time from 30s to 2s"""
-        import chess
         
         try:
-            board = chess.Board(self.fen)
-            
+            # Copy the cached board so pushing the move can't corrupt it
+            board = self._get_board().copy(stack=False)
+
             # Convert our coordinates to chess library format
             from_square = chess.square(from_col, 7 - from_row)
             to_square = chess.square(to_col, 7 - to_row)
             
-            # Create move - check for pawn promotion
-            move = chess.Move(from_square, to_square)
-            
-            # Auto-promote pawns to queens
-            piece = board.piece_at(from_square)
-            if piece and piece.piece_type == chess.PAWN:
-                if (piece.color == chess.WHITE and to_row == 0) or \
-                   (piece.color == chess.BLACK and to_row == 7):
-                    move = chess.Move(from_square, to_square, promotion=chess.QUEEN)
+            # Auto-promote pawns to queens - piece_type_at returns a plain
+            # int (no Piece allocation), and no color check is needed: only
+            # the side whose pawn can actually reach the back rank passes
+            # the legality test below
+            promotion = None
+            if board.piece_type_at(from_square) == chess.PAWN and to_row in (0, 7):
+                promotion = chess.QUEEN
+            move = chess.Move(from_square, to_square, promotion=promotion)
             
             # Check if move is legal
             if move not in board.legal_moves:
@@ -499,12 +405,15 @@ class ChessMatch(models.Model):
             
             # Make the move
             board.push(move)
-            
-            # Update our state
+
+            # Update our state - serialize the FEN once and seed the board
+            # cache with the already-pushed board, so follow-up legality and
+            # AI calls in the same request skip the reparse
             self.fen = board.fen()
+            self._board_cache = (self.fen, board)
             self.move_count += 1
-            self.sync_board_from_fen()
-            
+            self.white_to_move = board.turn
+
             return True
             
         except Exception as e:
@@ -512,47 +421,31 @@ class ChessMatch(models.Model):
             return False
     
     def is_in_check_fast(self, player=None):
-        """FAST check detection using chess library"""
-        import chess
-        
+        """FAST check detection using chess library
+
+        Attack detection doesn't care whose turn it is, so asking about
+        the off-turn player is just an attack test against that king - no
+        patched-FEN reparse like the old implementation needed
+        """
         try:
-            board = chess.Board(self.fen)
-            
+            board = self._get_board()
+
             if player is None:
                 return board.is_check()
-            
-            # For specific player check
-            if player == 'white':
-                if board.turn == chess.WHITE:
-                    return board.is_check()
-                else:
-                    # Create temp board with white to move
-                    temp_fen_parts = self.fen.split()
-                    temp_fen_parts[1] = 'w'
-                    temp_fen = ' '.join(temp_fen_parts)
-                    temp_board = chess.Board(temp_fen)
-                    return temp_board.is_check()
-            else:  # player == 'black'
-                if board.turn == chess.BLACK:
-                    return board.is_check()
-                else:
-                    # Create temp board with black to move
-                    temp_fen_parts = self.fen.split()
-                    temp_fen_parts[1] = 'b'
-                    temp_fen = ' '.join(temp_fen_parts)
-                    temp_board = chess.Board(temp_fen)
-                    return temp_board.is_check()
-                    
+
+            color = chess.WHITE if player == 'white' else chess.BLACK
+            king_square = board.king(color)
+            return king_square is not None and board.is_attacked_by(not color, king_square)
+
         except Exception as e:
             print(f"Error checking check fast: {e}")
             return False
     
     def is_game_over_fast(self):
         """FAST game over check using chess library"""
-        import chess
         
         try:
-            board = chess.Board(self.fen)
+            board = self._get_board()
             return board.is_game_over()
         except Exception as e:
             print(f"Error checking game over fast: {e}")
@@ -560,10 +453,9 @@ class ChessMatch(models.Model):
     
     def get_game_result_fast(self):
         """FAST game result using chess library"""
-        import chess
         
         try:
-            board = chess.Board(self.fen)
+            board = self._get_board()
             
             if board.is_checkmate():
                 # Current player is checkmated, so the other player wins
@@ -584,32 +476,31 @@ class ChessMatch(models.Model):
             return None
     
     def get_legal_moves_for_square(self, row, col):
-        """Get legal moves for piece at square (for UI highlighting)"""
-        import chess
-        
+        """Get legal moves for piece at square (for UI highlighting)
+
+        Returns a flat list of row * 8 + col ints rather than (row, col)
+        tuples - one small int per target square instead of a tuple
+        allocation, and the JSON payload stays primitive
+        """
         try:
-            board = chess.Board(self.fen)
+            board = self._get_board()
             from_square = chess.square(col, 7 - row)
-            
-            legal_moves = []
-            for move in board.legal_moves:
-                if move.from_square == from_square:
-                    to_row = 7 - (move.to_square // 8)
-                    to_col = move.to_square % 8
-                    legal_moves.append((to_row, to_col))
-            
-            return legal_moves
-            
+
+            # Rank-flipping a square index is just XOR 56, so row*8+col
+            # falls out of the move's square with one int op
+            return [move.to_square ^ 56
+                    for move in board.generate_legal_moves(from_mask=chess.BB_SQUARES[from_square])]
+
         except Exception as e:
             print(f"Error getting legal moves: {e}")
             return []
     
     def make_uci_move(self, uci_move):
         """Make a move from UCI notation (e.g., 'e2e4') - for AI integration"""
-        import chess
         
         try:
-            board = chess.Board(self.fen)
+            # Copy the cached board so pushing the move can't corrupt it
+            board = self._get_board().copy(stack=False)
             move = chess.Move.from_uci(uci_move)
             
             if move not in board.legal_moves:
@@ -617,6 +508,7 @@ class ChessMatch(models.Model):
             
             board.push(move)
             self.fen = board.fen()
+            self._board_cache = (self.fen, board)
             self.move_count += 1
             return True
             
@@ -1,34 +1,69 @@
 import chess
 import chess.engine
+import chess.polyglot
+import logging
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Optional, Tuple
 
+# Transposition table entry flags
+TT_EXACT = 0   # Score is exact for the stored depth
+TT_LOWER = 1   # Score is a lower bound (fail-high / beta cutoff)
+TT_UPPER = 2   # Score is an upper bound (fail-low)
+
+# Keep the table bounded: index by the low 20 bits of the Zobrist hash
+TT_MASK = (1 << 20) - 1
+
+# Upper bound on search depth for per-ply tables (killer moves)
+MAX_PLY = 64
+
+# Null-move pruning depth reduction
+NULL_MOVE_R = 2
+
+# Valid piece letters shared by our board arrays and FEN
+PIECE_SYMBOLS = frozenset('PRNBQKprnbqk')
+
+logger = logging.getLogger(__name__)
+
 class OptimizedChessAI:
     """Fast Chess AI using python-chess library with optimized minimax and alpha-beta pruning"""
     
-    def __init__(self, depth: int = 3, max_time: float = 2.0):
+    def __init__(self, depth: int = 3, max_time: float = 2.0,
+                 transposition_table: Optional[dict] = None):
         """
         Initialize the AI with configurable depth and time limits
-        
+
         Args:
             depth: Maximum search depth (3-4 recommended for fast play)
             max_time: Maximum thinking time in seconds
+            transposition_table: optional externally owned table, letting
+                several engines share one - positions transpose across
+                games (openings, common structures), entries are verified
+                against the full hash on probe, and the values are
+                immutable tuples written under the GIL, so concurrent
+                engines can share it without locking
         """
         self.depth = depth
         self.max_time = max_time
-        self.transposition_table: Dict[str, Tuple[float, int]] = {}
+        # Entries: masked hash -> (full hash, depth, score, flag, best_move)
+        if transposition_table is None:
+            transposition_table = {}
+        self.transposition_table: Dict[int, Tuple[int, int, float, int, Optional[chess.Move]]] = transposition_table
+        # Legal move lists keyed by Zobrist hash, valid for one search
+        self.legal_move_cache: Dict[int, list] = {}
+        # Two killer (quiet cutoff) moves per depth and a from/to history
+        # score table, both feeding move ordering when the TT has no hint
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history: Dict[Tuple[int, int], int] = {}
         self.start_time = 0
         self.nodes_searched = 0
+        self._timed_out = False
         
-        # Piece values for quick evaluation
-        self.PIECE_VALUES = {
-            chess.PAWN: 100,
-            chess.ROOK: 500,
-            chess.KNIGHT: 320,
-            chess.BISHOP: 330,
-            chess.QUEEN: 900,
-            chess.KING: 20000
-        }
+        # Piece values for quick evaluation, indexed directly by
+        # piece_type (PAWN=1 .. KING=6, slot 0 unused) - tuple subscript
+        # beats a dict hash lookup in the ordering/eval hot paths
+        self.PIECE_VALUES = (0, 100, 320, 330, 500, 900, 20000)
         
         # Piece-square tables for positional evaluation (simplified)
         self.PST = {
@@ -94,6 +129,29 @@ class OptimizedChessAI:
             ]
         }
 
+        # Flatten each PST to an immutable tuple per color, with the black
+        # view pre-mirrored (sq ^ 56 flips ranks), so the evaluation loop
+        # is a single tuple subscript with no square_mirror() calls
+        self.PST_WHITE = {
+            piece_type: tuple(table) for piece_type, table in self.PST.items()
+        }
+        self.PST_BLACK = {
+            piece_type: tuple(table[square ^ 56] for square in range(64))
+            for piece_type, table in self.PST.items()
+        }
+
+        # Combined (material + PST // 10) score per square, per piece type
+        # in evaluation order, one table per color - the eval loop is then
+        # a single subscript per piece with no division and no dict lookups
+        self._eval_info = tuple(
+            (tuple(self.PIECE_VALUES[piece_type] + entry // 10
+                   for entry in self.PST_WHITE[piece_type]),
+             tuple(self.PIECE_VALUES[piece_type] + entry // 10
+                   for entry in self.PST_BLACK[piece_type]))
+            for piece_type in (chess.PAWN, chess.KNIGHT, chess.BISHOP,
+                               chess.ROOK, chess.QUEEN, chess.KING)
+        )
+
     def get_best_move(self, fen: str) -> Optional[str]:
         """
         Get the best move for the current position
@@ -111,134 +169,371 @@ class OptimizedChessAI:
         
         self.start_time = time.time()
         self.nodes_searched = 0
-        self.transposition_table.clear()  # Clear for new search
-        
+        self._timed_out = False
+        # Deliberately NOT clearing the transposition table: entries are
+        # keyed by Zobrist hash and verified against the full hash on
+        # probe, so results from earlier searches of the same game are
+        # still exact - keeping them is what makes holding one engine per
+        # match worthwhile. Killer/history scores are only ordering hints,
+        # and stale ones lose nothing. The legal move cache is cleared:
+        # unlike the fixed-size TT it is unbounded (one Move list per
+        # position visited), and the TT already carries the cross-search
+        # value, so letting it grow for the life of a match buys nothing.
+        self.legal_move_cache.clear()
+
+        # Seed the first iteration from the transposition table: with the
+        # engine persisted across moves, the previous search usually probed
+        # this very position while replying and left its best move behind,
+        # so even depth 1 starts with principal-variation-first ordering
         best_move = None
-        best_score = float('-inf') if board.turn else float('inf')
-        
-        # Get and order moves (captures and checks first for better pruning)
-        moves = self.order_moves(board, list(board.legal_moves))
-        
+        board_hash = chess.polyglot.zobrist_hash(board)
+        entry = self.transposition_table.get(board_hash & TT_MASK)
+        if entry is not None and entry[0] == board_hash and entry[4] is not None:
+            best_move = entry[4]
+
+        # Iterative deepening: each iteration seeds the next with its best
+        # move (the principal variation) and leaves its TT entries behind,
+        # so deeper searches cut off far more than a cold fixed-depth search
+        for current_depth in range(1, self.depth + 1):
+            # Don't start an iteration past half the budget: each depth
+            # costs more than all shallower ones combined, so it would
+            # almost certainly be cut off before producing a usable move
+            if time.time() - self.start_time > self.max_time * 0.5:
+                break
+
+            move = self.search_root(board, current_depth, best_move)
+            if self._timed_out:
+                # The iteration was interrupted: its scores mix finished
+                # subtrees with truncated static evals, so its pick is
+                # not trustworthy. Keep the deepest completed iteration's
+                # move instead.
+                break
+            if move is not None:
+                best_move = move
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AI searched %d nodes in %.2fs",
+                         self.nodes_searched, time.time() - self.start_time)
+        return str(best_move) if best_move else None
+
+    def get_best_move_parallel(self, fen: str, max_workers: Optional[int] = None) -> Optional[str]:
+        """
+        Root-parallel variant of get_best_move: score each root move in its
+        own process and take the argmax
+
+        Root moves are independent once pushed, so this is embarrassingly
+        parallel; each worker pays its own search without a shared alpha
+        bound, trading some duplicated work for N-core throughput. Opt-in:
+        the per-request pool startup only pays off for long searches, so
+        the views keep using the sequential get_best_move by default
+        """
+        board = chess.Board(fen)
+
+        if board.is_game_over():
+            return None
+
+        legal_moves = list(board.legal_moves)
+        if len(legal_moves) == 1:
+            return str(legal_moves[0])
+
+        jobs = [(fen, move.uci(), self.depth, self.max_time) for move in legal_moves]
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            results = list(executor.map(_evaluate_root_move, jobs))
+
+        best_uci, _ = max(results, key=lambda result: result[1])
+        return best_uci
+
+    def search_root(self, board: chess.Board, depth: int, pv_move=None) -> Optional[chess.Move]:
+        """
+        Run one fixed-depth search from the root, trying the previous
+        iteration's best move first
+
+        Returns the best move found, or None if time ran out before any
+        move was fully searched
+        """
+        best_move = None
+        best_score = float('-inf')
+        color = 1 if board.turn else -1
+
+        # order_moves takes any iterable; no intermediate list needed here
+        moves = self.order_moves(board, board.legal_moves, pv_move)
+
         for move in moves:
-            if time.time() - self.start_time > self.max_time:
+            if self._timed_out:
                 break
-                
+
             board.push(move)
-            
-            # Search with iterative deepening for better time management
-            score = self.minimax(board, self.depth - 1, not board.turn, 
-                               float('-inf'), float('inf'))
-            
+            score = -self.negamax(board, depth - 1,
+                                float('-inf'), float('inf'), -color)
             board.pop()
-            
-            if board.turn:  # White to move (maximizing)
-                if score > best_score:
-                    best_score = score
-                    best_move = move
-            else:  # Black to move (minimizing)  
-                if score < best_score:
-                    best_score = score
-                    best_move = move
-        
-        print(f"AI searched {self.nodes_searched} nodes in {time.time() - self.start_time:.2f}s")
-        return str(best_move) if best_move else None
 
-    def order_moves(self, board: chess.Board, moves: list) -> list:
+            if self._timed_out:
+                # Time expired inside this subtree, so the score is built
+                # on truncated static evals - discard it rather than let
+                # it win the score > best_score comparison
+                break
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+        return best_move
+
+    def out_of_time(self) -> bool:
+        """
+        Amortized time check: time.time() on every node is a measurable
+        cost at search speed, so only poll the clock every 1024 nodes and
+        latch the result, letting every later node exit on a plain
+        attribute read
+        """
+        if self._timed_out:
+            return True
+        if (self.nodes_searched & 1023) == 0 and \
+                time.time() - self.start_time > self.max_time:
+            self._timed_out = True
+            return True
+        return False
+
+    def order_moves(self, board: chess.Board, moves: list, tt_best=None,
+                    killers=None) -> list:
         """
         Order moves for better alpha-beta pruning
-        Captures and checks first, then other moves
+        Transposition-table best move first, then captures by MVV-LVA,
+        then killer moves and history-scored quiet moves
         """
         def move_priority(move):
             priority = 0
-            
-            # Captures get high priority
+
+            # Captures ordered by MVV-LVA (most valuable victim, least
+            # valuable attacker); piece_type_at returns a plain int, so no
+            # Piece objects are constructed while ordering
             if board.is_capture(move):
-                captured_piece = board.piece_at(move.to_square)
-                if captured_piece:
-                    priority += self.PIECE_VALUES[captured_piece.piece_type] // 10
-                    
-            # Checks get priority
-            board.push(move)
-            if board.is_check():
+                if board.is_en_passant(move):
+                    # En passant captures have an empty to_square
+                    victim_value = self.PIECE_VALUES[chess.PAWN]
+                else:
+                    victim_value = self.PIECE_VALUES[board.piece_type_at(move.to_square)]
+                priority += 10 * victim_value - self.PIECE_VALUES[board.piece_type_at(move.from_square)]
+            else:
+                # Quiet moves: killers from this depth first, then moves
+                # that caused cutoffs elsewhere in the tree (history)
+                if killers is not None:
+                    if move == killers[0]:
+                        priority += 900
+                    elif move == killers[1]:
+                        priority += 850
+                priority += min(self.history.get((move.from_square, move.to_square), 0), 800)
+
+            # Checks get priority - gives_check tests without mutating the
+            # board, saving a full push/pop pair per move ordered
+            if board.gives_check(move):
                 priority += 50
-            board.pop()
-            
+
             # Promotions get priority
             if move.promotion:
                 priority += 800
                 
             return -priority  # Negative for descending sort
-        
+
+        # The TT best move goes first outright; pulling it out here avoids
+        # an equality test against it inside the key for every other move.
+        # Single pass so moves may be any iterable, not just a list
+        if tt_best is not None:
+            rest = []
+            found = False
+            for move in moves:
+                if move == tt_best:
+                    found = True
+                else:
+                    rest.append(move)
+            rest.sort(key=move_priority)
+            return [tt_best, *rest] if found else rest
+
         return sorted(moves, key=move_priority)
 
-    def minimax(self, board: chess.Board, depth: int, is_maximizing: bool, 
-                alpha: float, beta: float) -> float:
+    def store_transposition(self, board_hash: int, depth: int, score: float,
+                            alpha_orig: float, beta_orig: float, best_move) -> None:
+        """Store a search result in the transposition table with its bound flag"""
+        if score <= alpha_orig:
+            flag = TT_UPPER
+        elif score >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.transposition_table[board_hash & TT_MASK] = (board_hash, depth, score, flag, best_move)
+
+    def negamax(self, board: chess.Board, depth: int,
+                alpha: float, beta: float, color: int,
+                null_allowed: bool = True) -> float:
         """
-        Minimax with alpha-beta pruning and transposition table
+        Negamax with alpha-beta pruning and transposition table
+
+        Scores are from the side to move's perspective: color is +1 when
+        white is to move, -1 when black is, and each recursion negates the
+        child score with a flipped window instead of duplicating
+        maximizing/minimizing branches
         """
         self.nodes_searched += 1
-        
-        # Check time limit
-        if time.time() - self.start_time > self.max_time:
-            return self.evaluate_position(board)
-        
-        # Check transposition table
-        board_hash = str(board.fen())
-        if board_hash in self.transposition_table:
-            stored_score, stored_depth = self.transposition_table[board_hash]
-            if stored_depth >= depth:
+
+        # Check time limit (amortized - see out_of_time)
+        if self.out_of_time():
+            return color * self.evaluate_position(board)
+
+        # Remember the caller's window so we can classify the stored bound
+        alpha_orig = alpha
+        beta_orig = beta
+
+        # Probe the transposition table (Zobrist hash, not FEN strings);
+        # mask the index once per node, it is reused at every store below
+        board_hash = chess.polyglot.zobrist_hash(board)
+        tt_index = board_hash & TT_MASK
+        entry = self.transposition_table.get(tt_index)
+        if entry is not None and entry[0] != board_hash:
+            entry = None  # Index collision with a different position
+        tt_best = entry[4] if entry is not None else None
+        if entry is not None and entry[1] >= depth:
+            stored_score, flag = entry[2], entry[3]
+            if flag == TT_EXACT:
                 return stored_score
-        
+            elif flag == TT_LOWER:
+                alpha = max(alpha, stored_score)
+            else:  # TT_UPPER
+                beta = min(beta, stored_score)
+            if alpha >= beta:
+                return stored_score
+
         # Terminal conditions
-        if depth == 0 or board.is_game_over():
-            score = self.evaluate_position(board)
-            self.transposition_table[board_hash] = (score, depth)
+        if board.is_game_over():
+            score = color * self.evaluate_position(board)
+            self.transposition_table[tt_index] = (board_hash, depth, score, TT_EXACT, None)
             return score
-        
-        legal_moves = list(board.legal_moves)
+
+        # At the horizon, resolve captures with quiescence search instead of
+        # trusting the static eval of a possibly tactical position
+        if depth == 0:
+            score = self.quiesce(board, alpha, beta, color)
+            if not self._timed_out:
+                self.store_transposition(board_hash, 0, score, alpha_orig, beta_orig, None)
+            return score
+
+        # Null-move pruning: give the opponent a free move and search
+        # shallower with a null window - if we still beat beta, a real
+        # search would too. Skipped in check (illegal) and when the side to
+        # move has only king and pawns (zugzwang risk), and never twice in
+        # a row (null_allowed)
+        if (null_allowed and depth >= 2 and not board.is_check()
+                and board.occupied_co[board.turn] & (board.knights | board.bishops
+                                                     | board.rooks | board.queens)):
+            board.push(chess.Move.null())
+            score = -self.negamax(board, max(depth - 1 - NULL_MOVE_R, 0),
+                                -beta, -beta + 1, -color, False)
+            board.pop()
+            if score >= beta:
+                return beta
+
+        # Transpositions re-enter the same position many times; generate its
+        # legal moves once and reuse the list on later visits
+        legal_moves = self.legal_move_cache.get(board_hash)
+        if legal_moves is None:
+            legal_moves = list(board.legal_moves)
+            self.legal_move_cache[board_hash] = legal_moves
         if not legal_moves:
-            if board.is_check():
-                # Checkmate
-                score = -20000 if is_maximizing else 20000
-            else:
-                # Stalemate
-                score = 0
-            self.transposition_table[board_hash] = (score, depth)
+            # Checkmate (side to move is mated) or stalemate
+            score = -20000 if board.is_check() else 0
+            self.transposition_table[tt_index] = (board_hash, depth, score, TT_EXACT, None)
             return score
-        
+
         # Order moves for better pruning
-        moves = self.order_moves(board, legal_moves)
-        
-        if is_maximizing:
-            max_score = float('-inf')
-            for move in moves:
-                board.push(move)
-                score = self.minimax(board, depth - 1, False, alpha, beta)
-                board.pop()
-                
-                max_score = max(score, max_score)
-                alpha = max(alpha, score)
-                
-                if beta <= alpha:
-                    break  # Alpha-beta cutoff
-            
-            self.transposition_table[board_hash] = (max_score, depth)
-            return max_score
-        else:
-            min_score = float('inf')
-            for move in moves:
-                board.push(move)
-                score = self.minimax(board, depth - 1, True, alpha, beta)
-                board.pop()
-                
-                min_score = min(score, min_score)
-                beta = min(beta, score)
-                
-                if beta <= alpha:
-                    break  # Alpha-beta cutoff
-            
-            self.transposition_table[board_hash] = (min_score, depth)
-            return min_score
+        killers = self.killers[depth] if depth < MAX_PLY else None
+        moves = self.order_moves(board, legal_moves, tt_best, killers)
+
+        # Bind the hot callables once; LOAD_FAST in the move loop is the
+        # closest a pure-Python search gets to compiled dispatch
+        push = board.push
+        pop = board.pop
+        negamax = self.negamax
+        child_depth = depth - 1
+
+        best_score = float('-inf')
+        best_move = None
+        for move in moves:
+            push(move)
+            score = -negamax(board, child_depth, -beta, -alpha, -color)
+            pop()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+
+            if alpha >= beta:
+                # Remember quiet moves that refuted this position: killers
+                # for this depth, plus a depth-weighted history bump
+                if killers is not None and not board.is_capture(move):
+                    if move != killers[0]:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                    key = (move.from_square, move.to_square)
+                    self.history[key] = self.history.get(key, 0) + depth * depth
+                break  # Beta cutoff (equality prunes too)
+
+        # Never store after time has expired: truncated children returned
+        # bare static evals, and with the table persisted across moves (and
+        # shared across matches) a poisoned entry at this node's claimed
+        # depth would be trusted as exact by the very next search
+        if self._timed_out:
+            return best_score
+
+        self.store_transposition(board_hash, depth, best_score, alpha_orig, beta_orig, best_move)
+        return best_score
+
+    def quiesce(self, board: chess.Board, alpha: float, beta: float,
+                color: int) -> float:
+        """
+        Quiescence search: extend the search through capture sequences only,
+        so leaf evaluations are taken in quiet positions
+
+        Negamax form, like the main search: scores are from the side to
+        move's perspective (color is +1 for white, -1 for black) and the
+        window is negated and swapped on recursion, so there is a single
+        code path instead of mirrored maximizing/minimizing branches
+
+        Terminates naturally when no captures remain (or the stand-pat
+        score already fails the window)
+        """
+        self.nodes_searched += 1
+
+        stand_pat = color * self.evaluate_position(board)
+
+        # Out of time: the stand-pat score is the best we can do
+        if self.out_of_time():
+            return stand_pat
+
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        # Generate captures directly instead of generating every legal move
+        # and filtering - quiet positions exit after an empty generator
+        captures = list(board.generate_legal_captures())
+        if not captures:
+            return stand_pat
+
+        best_score = stand_pat
+        for move in self.order_moves(board, captures):
+            board.push(move)
+            score = -self.quiesce(board, -beta, -alpha, -color)
+            board.pop()
+
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        return best_score
 
     def evaluate_position(self, board: chess.Board) -> float:
         """
@@ -251,79 +546,113 @@ class OptimizedChessAI:
             return 0
         
         score = 0
+
+        # Material and positional evaluation - iterate set bits of each piece
+        # bitboard instead of probing all 64 squares through piece_at()
+        white = board.occupied_co[chess.WHITE]
+        black = board.occupied_co[chess.BLACK]
+
+        for (table_white, table_black), type_bb in zip(
+            self._eval_info,
+            (board.pawns, board.knights, board.bishops,
+             board.rooks, board.queens, board.kings),
+        ):
+            bb = type_bb & white
+            while bb:
+                score += table_white[(bb & -bb).bit_length() - 1]
+                bb &= bb - 1
+
+            bb = type_bb & black
+            while bb:
+                score -= table_black[(bb & -bb).bit_length() - 1]
+                bb &= bb - 1
         
-        # Material and positional evaluation
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                value = self.PIECE_VALUES[piece.piece_type]
-                
-                # Positional bonus
-                if piece.piece_type in self.PST:
-                    square_index = square if piece.color else chess.square_mirror(square)
-                    value += self.PST[piece.piece_type][square_index] // 10
-                
-                # Apply color
-                if piece.color == chess.WHITE:
-                    score += value
-                else:
-                    score -= value
-        
-        # Mobility bonus (number of legal moves)
-        mobility = len(list(board.legal_moves))
-        score += mobility * 2 if board.turn else -mobility * 2
-        
+        # Side-to-move terms share one sign instead of branching twice
+        sign = 1 if board.turn else -1
+
+        # Mobility bonus (number of legal moves, counted without
+        # materializing a Move list)
+        score += sign * board.legal_moves.count() * 2
+
         # King safety
         if board.is_check():
-            score += -50 if board.turn else 50
-            
+            score -= sign * 50
+
         return score
 
     def board_to_fen(self, board_array) -> str:
         """
         Convert our internal board representation to FEN string
         """
-        # Map our pieces to python-chess format
-        piece_map = {
-            'P': 'P', 'R': 'R', 'N': 'N', 'B': 'B', 'Q': 'Q', 'K': 'K',
-            'p': 'p', 'r': 'r', 'n': 'n', 'b': 'b', 'q': 'q', 'k': 'k'
-        }
-        
-        fen_rows = []
-        for row in board_array:
-            fen_row = ""
-            empty_count = 0
-            
-            for cell in row:
-                if cell == '' or cell is None:
-                    empty_count += 1
-                else:
-                    if empty_count > 0:
-                        fen_row += str(empty_count)
-                        empty_count = 0
-                    fen_row += piece_map.get(cell, '')
-            
-            if empty_count > 0:
-                fen_row += str(empty_count)
-            fen_rows.append(fen_row)
-        
-        board_fen = "/".join(fen_rows)
-        
-        # Default additional FEN components (we'll improve this later)
-        return f"{board_fen} w KQkq - 0 1"
+        return board_to_fen(board_array)
 
     def fen_to_board_array(self, fen: str) -> list:
         """
         Convert FEN string to our internal board representation
+
+        Parses the placement field directly in one pass - no chess.Board
+        (and its bitboard setup) is constructed just to read pieces back
         """
-        board = chess.Board(fen)
         board_array = [['' for _ in range(8)] for _ in range(8)]
-        
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                row = 7 - (square // 8)  # Convert to our coordinate system
-                col = square % 8
-                board_array[row][col] = str(piece)
-        
-        return board_array
\ No newline at end of file
+
+        placement = fen.split(' ', 1)[0]
+        for row, rank in enumerate(placement.split('/')):
+            col = 0
+            for char in rank:
+                if char.isdigit():
+                    col += int(char)
+                else:
+                    board_array[row][col] = char
+                    col += 1
+
+        return board_array
+
+def board_to_fen(board_array) -> str:
+    """
+    Convert an 8x8 board array to a FEN string
+
+    Module-level so callers don't need to construct an engine (with its
+    evaluation tables) just to serialize a position
+    """
+    fen_rows = []
+    for row in board_array:
+        fen_row = ""
+        empty_count = 0
+
+        for cell in row:
+            if cell == '' or cell is None:
+                empty_count += 1
+            else:
+                if empty_count > 0:
+                    fen_row += str(empty_count)
+                    empty_count = 0
+                if cell in PIECE_SYMBOLS:
+                    fen_row += cell
+
+        if empty_count > 0:
+            fen_row += str(empty_count)
+        fen_rows.append(fen_row)
+
+    board_fen = "/".join(fen_rows)
+
+    # Default additional FEN components (we'll improve this later)
+    return f"{board_fen} w KQkq - 0 1"
+
+def _evaluate_root_move(args) -> Tuple[str, float]:
+    """
+    Process-pool worker: score a single root move from the parent position
+
+    Builds its own engine instance (workers share nothing), pushes the
+    move and searches the remaining depth, returning the score from the
+    root side's perspective
+    """
+    fen, move_uci, depth, max_time = args
+
+    board = chess.Board(fen)
+    color = 1 if board.turn else -1
+    board.push(chess.Move.from_uci(move_uci))
+
+    ai = OptimizedChessAI(depth=depth, max_time=max_time)
+    ai.start_time = time.time()
+    score = -ai.negamax(board, depth - 1, float('-inf'), float('inf'), -color)
+    return move_uci, score
@@ -30,7 +30,11 @@ class TicTacToeMoveSerializer(serializers.Serializer):
 
 class ChessMatchSerializer(serializers.ModelSerializer):
     match = MatchSerializer(read_only=True)
-    
+    # board and current_player are derived from the FEN on the model,
+    # not DB columns
+    board = serializers.ReadOnlyField()
+    current_player = serializers.ReadOnlyField()
+
     class Meta:
         model = ChessMatch
         fields = ['id', 'match', 'board', 'current_player', 'fen', 'move_count']
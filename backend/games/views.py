@@ -1,28 +1,135 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from django.contrib.auth import get_user_model
 
-from .models import Game, Match, TicTacToeMatch, ChessMatch
+from .models import Game, Match, TicTacToeMatch, ChessMatch, SQ_TO_RC
 from .serializers import (
-    GameSerializer, MatchSerializer, TicTacToeMatchSerializer, 
-    TicTacToeMoveSerializer, ChessMatchSerializer, ChessMoveSerializer
+    GameSerializer, TicTacToeMatchSerializer,
+    TicTacToeMoveSerializer, ChessMatchSerializer
 )
 from .ai_engine import TicTacToeAI
 from .optimized_chess_ai import OptimizedChessAI
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+# The Game rows are immutable seed data, so after the first lookup every
+# match start can skip the get_or_create round-trip
+_GAME_CACHE = {}
+
+def _get_game(game_type, defaults):
+    game = _GAME_CACHE.get(game_type)
+    if game is None:
+        game, _ = Game.objects.get_or_create(game_type=game_type, defaults=defaults)
+        _GAME_CACHE[game_type] = game
+    return game
+
+def _fetch_match_pair(request, match_id, relation):
+    """Fetch the Match and its game-specific row with one JOINed query
+
+    Every game endpoint needs both objects; select_related on the
+    reverse one-to-one halves the per-request SELECT count
+    """
+    match = get_object_or_404(
+        Match.objects.select_related(relation), id=match_id, player=request.user)
+    try:
+        game_match = getattr(match, relation)
+    except ObjectDoesNotExist:
+        raise Http404(f"No {relation} for match {match_id}")
+    return match, game_match
+
+def _match_rows(user):
+    """Match list as plain dicts for the read-only endpoints
+
+    Same keys as MatchSerializer, but projected straight from the DB
+    with values() - no Field dispatch or per-row serializer machinery,
+    and only the columns the payload needs leave the database
+    """
+    return Match.objects_raw.filter(player=user).values(
+        'id', 'opponent', 'status', 'result', 'started_at',
+        'completed_at', 'game_state', 'moves_history',
+        game_name=F('game__name'), game_type=F('game__game_type'),
+    ).order_by('-started_at')
+
+_GAME_ROW_FIELDS = ('id', 'name', 'game_type', 'description',
+                    'max_players', 'min_players')
+
+# Worker pool that runs the AI search off the request thread, so the
+# search overlaps the request's own DB writes; comfortably above the
+# engine's 2.0s budget so a healthy search never trips it
+_AI_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+AI_MOVE_TIMEOUT = 10.0
+
+# One engine per active chess match, so the transposition table and
+# move-ordering heuristics built during one search carry into the next
+# move's search instead of being thrown away per request. Entries are
+# dropped when the game finishes (see check_chess_game_result_fast) and
+# swept in _get_chess_ai once a match has gone quiet - an abandoned game
+# would otherwise pin its engine for the life of the process.
+#
+# All engines share one transposition table: positions transpose across
+# games too (openings, common structures), entries are full-hash
+# verified, and the masked index space caps it at 2^20 slots. Killer,
+# history and legal-move caches stay per-engine and die with the match.
+_SHARED_TT = {}
+_AI_POOL = {}  # match id -> (engine, monotonic time of last use)
+_AI_POOL_TTL = 30 * 60  # seconds without a move before an engine is swept
+
+def _get_chess_ai(match_id):
+    now = time.monotonic()
+    for stale_id, (_, last_used) in list(_AI_POOL.items()):
+        if stale_id != match_id and now - last_used > _AI_POOL_TTL:
+            _AI_POOL.pop(stale_id, None)
+    entry = _AI_POOL.get(match_id)
+    ai = entry[0] if entry is not None else OptimizedChessAI(
+        depth=3, max_time=2.0, transposition_table=_SHARED_TT)
+    _AI_POOL[match_id] = (ai, now)
+    return ai
+
+_CHESS_MOVE_KEYS = ('from_row', 'from_col', 'to_row', 'to_col')
+
+def _read_chess_move(data):
+    """Pull the four board coordinates out of a move request without a
+    serializer round-trip - returns None on any missing or out-of-range value"""
+    try:
+        coords = [int(data[k]) for k in _CHESS_MOVE_KEYS]
+    except (KeyError, TypeError, ValueError):
+        return None
+    # 0 <= v < 8 for all four at once: any negative or >7 value sets a
+    # bit outside the low three
+    if (coords[0] | coords[1] | coords[2] | coords[3]) & ~7:
+        return None
+    return coords
+
+# Cached per user via the Authorization header; the payload is plain
+# dicts (values() rows), which also keeps the cache pickle cheap -
+# DRF's ReturnDict/ReturnList wrappers pickle measurably slower
+@cache_page(30)
+@vary_on_headers('Authorization')
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def dashboard(request):
     """Get dashboard data for the user"""
     user = request.user
-    recent_matches = Match.objects.filter(player=user).order_by('-started_at')[:10]
-    
+
     dashboard_data = {
         'user': {
             'username': user.username,
@@ -32,10 +139,10 @@ def dashboard(request):
             'total_draws': user.total_draws,
             'win_rate': user.win_rate,
         },
-        'recent_matches': MatchSerializer(recent_matches, many=True).data,
-        'available_games': GameSerializer(Game.objects.all(), many=True).data,
+        'recent_matches': list(_match_rows(user)[:10]),
+        'available_games': list(Game.objects.values(*_GAME_ROW_FIELDS)),
     }
-    
+
     return Response(dashboard_data)
 
 @api_view(['GET'])
@@ -51,8 +158,8 @@ def start_tic_tac_toe(request):
     """Start a new Tic Tac Toe game"""
     try:
         # Get or create Tic Tac Toe game
-        game, created = Game.objects.get_or_create(
-            game_type='tic_tac_toe',
+        game = _get_game(
+            'tic_tac_toe',
             defaults={
                 'name': 'Tic Tac Toe',
                 'description': 'Classic 3x3 board game',
@@ -84,17 +191,16 @@ def start_tic_tac_toe(request):
 @permission_classes([IsAuthenticated])
 def get_tic_tac_toe_match(request, match_id):
     """Get current state of a Tic Tac Toe match"""
-    match = get_object_or_404(Match, id=match_id, player=request.user)
-    tic_tac_toe_match = get_object_or_404(TicTacToeMatch, match=match)
+    match, tic_tac_toe_match = _fetch_match_pair(request, match_id, 'tictactoematch')
     
     return Response(TicTacToeMatchSerializer(tic_tac_toe_match).data)
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@transaction.atomic
 def make_tic_tac_toe_move(request, match_id):
     """Make a move in Tic Tac Toe game"""
-    match = get_object_or_404(Match, id=match_id, player=request.user)
-    tic_tac_toe_match = get_object_or_404(TicTacToeMatch, match=match)
+    match, tic_tac_toe_match = _fetch_match_pair(request, match_id, 'tictactoematch')
     
     if match.status != 'in_progress':
         return Response({'error': 'Game is not in progress'}, 
@@ -112,66 +218,88 @@ def make_tic_tac_toe_move(request, match_id):
     if tic_tac_toe_match.current_player != 'X':
         return Response({'error': 'Not your turn'}, status=status.HTTP_400_BAD_REQUEST)
     
-    # Make player move
-    if not tic_tac_toe_match.make_move(row, col, 'X'):
+    # Make player move in memory; the board is persisted once per turn
+    if not tic_tac_toe_match.make_move(row, col, 'X', commit=False):
         return Response({'error': 'Invalid move'}, status=status.HTTP_400_BAD_REQUEST)
-    
+
+    # Both half-moves of this turn share one timestamp - computed and
+    # formatted once
+    now_iso = timezone.now().isoformat()
+
     # Add move to history
     match.add_move({
         'player': 'X',
         'row': row,
         'col': col,
-        'timestamp': timezone.now().isoformat()
+        'timestamp': now_iso
     })
-    
+
     # Check if game is over after player move
     game_result = check_game_result(tic_tac_toe_match, match, request.user)
     if game_result:
+        tic_tac_toe_match.save(update_fields=['board', 'current_player'])
         return Response(game_result)
-    
+
     # Make AI move
     ai = TicTacToeAI()
     ai_row, ai_col = ai.get_best_move(tic_tac_toe_match.board)
-    tic_tac_toe_match.make_move(ai_row, ai_col, 'O')
-    
+    tic_tac_toe_match.make_move(ai_row, ai_col, 'O', commit=False)
+
     # Add AI move to history
     match.add_move({
         'player': 'O',
         'row': ai_row,
         'col': ai_col,
-        'timestamp': timezone.now().isoformat()
+        'timestamp': now_iso
     })
-    
+
+    # One board write for the whole turn (human + AI)
+    tic_tac_toe_match.save(update_fields=['board', 'current_player'])
+
     # Check if game is over after AI move
     game_result = check_game_result(tic_tac_toe_match, match, request.user)
     if game_result:
         return Response(game_result)
-    
+
+    # Persist both history entries in a single write
+    match.flush_moves()
+
     return Response({
         'tic_tac_toe_match': TicTacToeMatchSerializer(tic_tac_toe_match).data,
         'ai_move': {'row': ai_row, 'col': ai_col}
     })
 
+_RESULT_STAT_FIELD = {'win': 'total_wins', 'lose': 'total_losses', 'draw': 'total_draws'}
+
+def _record_result_stats(user, result):
+    """Bump the user's stat counters with a single atomic UPDATE
+
+    F() expressions push the arithmetic into SQL, so two games finishing
+    at once can't lose an increment to a read-modify-write race
+    """
+    stat_field = _RESULT_STAT_FIELD[result]
+    User.objects.filter(pk=user.pk).update(
+        total_games=F('total_games') + 1,
+        **{stat_field: F(stat_field) + 1},
+    )
+
 def check_game_result(tic_tac_toe_match, match, user):
     """Check if the game is over and update match result"""
     if tic_tac_toe_match.is_game_over():
         winner = tic_tac_toe_match.check_winner()
         match.status = 'completed'
         match.completed_at = timezone.now()
-        
+
         if winner == 'X':
             match.result = 'win'
-            user.total_wins += 1
         elif winner == 'O':
             match.result = 'lose'
-            user.total_losses += 1
         else:
             match.result = 'draw'
-            user.total_draws += 1
-        
-        user.total_games += 1
-        user.save()
-        match.save()
+
+        _record_result_stats(user, match.result)
+        # moves_history rides along so pending add_move() entries are kept
+        match.save(update_fields=['status', 'completed_at', 'result', 'moves_history'])
         
         return {
             'game_over': True,
@@ -186,21 +314,21 @@ def check_game_result(tic_tac_toe_match, match, user):
 @permission_classes([IsAuthenticated])
 def match_history(request):
     """Get match history for the user"""
-    matches = Match.objects.filter(player=request.user).order_by('-started_at')
-    return Response(MatchSerializer(matches, many=True).data)
+    return Response(list(_match_rows(request.user)))
 
 # Chess Views
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def start_chess(request):
     """Start a new Chess game"""
-    print(f"🔥 start_chess called by user: {request.user}")
-    print(f"🔥 Request method: {request.method}")
-    print(f"🔥 Request headers: {dict(request.headers)}")
+    # Guarded so the header dict is never built unless DEBUG logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("start_chess user=%s headers=%s",
+                     request.user, dict(request.headers))
     try:
-        # Get or create Chess game
-        game, created = Game.objects.get_or_create(
-            game_type='chess',
+        # Get or create Chess game (cached after the first start)
+        game = _get_game(
+            'chess',
             defaults={
                 'name': 'Chess',
                 'description': 'Classic chess game with AI opponent',
@@ -226,21 +354,18 @@ def start_chess(request):
         }, status=status.HTTP_201_CREATED)
         
     except Exception as e:
-        import traceback
-        error_details = {
-            'error': str(e),
-            'type': type(e).__name__,
-            'traceback': traceback.format_exc()
-        }
-        print(f"Chess start error: {error_details}")
+        logger.exception("Chess start failed")
+        error_details = {'error': str(e), 'type': type(e).__name__}
+        if settings.DEBUG:
+            import traceback
+            error_details['traceback'] = traceback.format_exc()
         return Response(error_details, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_chess_match(request, match_id):
     """Get current state of a Chess match"""
-    match = get_object_or_404(Match, id=match_id, player=request.user)
-    chess_match = get_object_or_404(ChessMatch, match=match)
+    match, chess_match = _fetch_match_pair(request, match_id, 'chessmatch')
     
     # Add additional game state info using FAST methods
     response_data = ChessMatchSerializer(chess_match).data
@@ -248,60 +373,70 @@ def get_chess_match(request, match_id):
         'white': chess_match.is_in_check_fast('white'),
         'black': chess_match.is_in_check_fast('black')
     }
-    response_data['is_game_over'] = chess_match.is_game_over_fast()
-    
-    if chess_match.is_game_over_fast():
+    # One legal-move generation, not two - it's the most expensive call here
+    game_over = chess_match.is_game_over_fast()
+    response_data['is_game_over'] = game_over
+
+    if game_over:
         response_data['game_result'] = chess_match.get_game_result_fast()
-    
+
     return Response(response_data)
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@transaction.atomic
 def make_chess_move(request, match_id):
     """Make a move in Chess game"""
-    match = get_object_or_404(Match, id=match_id, player=request.user)
-    chess_match = get_object_or_404(ChessMatch, match=match)
+    match, chess_match = _fetch_match_pair(request, match_id, 'chessmatch')
     
     if match.status != 'in_progress':
         return Response({'error': 'Game is not in progress'}, 
                        status=status.HTTP_400_BAD_REQUEST)
     
-    # Validate move
-    move_serializer = ChessMoveSerializer(data=request.data)
-    if not move_serializer.is_valid():
-        return Response(move_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    
-    from_row = move_serializer.validated_data['from_row']
-    from_col = move_serializer.validated_data['from_col']
-    to_row = move_serializer.validated_data['to_row']
-    to_col = move_serializer.validated_data['to_col']
+    # Validate move inline - this endpoint is hit on every half-move, so
+    # skip the DRF serializer machinery for four bounded ints
+    coords = _read_chess_move(request.data)
+    if coords is None:
+        return Response({'error': 'Invalid move coordinates'},
+                       status=status.HTTP_400_BAD_REQUEST)
+    from_row, from_col, to_row, to_col = coords
     
     # Check if it's player's turn (human plays white)
-    if chess_match.current_player != 'white':
+    if not chess_match.white_to_move:
         return Response({'error': 'Not your turn'}, status=status.HTTP_400_BAD_REQUEST)
     
     # Make player move using FAST method
     if not chess_match.make_move_fast(from_row, from_col, to_row, to_col):
         return Response({'error': 'Invalid move'}, status=status.HTTP_400_BAD_REQUEST)
-    
-    chess_match.save()  # Make sure board is synced
-    
+
+    # Kick off the AI search immediately - it only needs the FEN snapshot,
+    # so it runs on a worker thread while this thread does the DB write,
+    # history append and game-over bookkeeping below
+    ai_future = _AI_EXECUTOR.submit(
+        _get_chess_ai(match.id).get_best_move, chess_match.fen)
+
+    # Both half-moves of this turn share one timestamp - computed and
+    # formatted once
+    now_iso = timezone.now().isoformat()
+
     # Add move to history
     match.add_move({
         'player': 'white',
         'from': [from_row, from_col],
         'to': [to_row, to_col],
-        'timestamp': timezone.now().isoformat()
+        'timestamp': now_iso
     })
-    
+
     # Check if game is over after player move (using FAST method)
     game_result = check_chess_game_result_fast(chess_match, match, request.user)
     if game_result:
+        # The speculative search sees a final position and exits at once
+        ai_future.cancel()
+        chess_match.save(update_fields=['fen', 'move_count', 'white_to_move'])
         return Response(game_result)
-    
-    # Make AI move using optimized engine
-    ai = OptimizedChessAI(depth=3, max_time=2.0)  # Fast 2-second max
-    ai_move_uci = ai.get_best_move(chess_match.fen)
+
+    # Collect the AI move computed while the writes above ran
+    ai_move_uci = ai_future.result(timeout=AI_MOVE_TIMEOUT)
     
     if ai_move_uci:
         import chess
@@ -313,29 +448,32 @@ def make_chess_move(request, match_id):
         from_square = move.from_square
         to_square = move.to_square
         
-        ai_from_row = 7 - (from_square // 8)
-        ai_from_col = from_square % 8
-        ai_to_row = 7 - (to_square // 8)
-        ai_to_col = to_square % 8
+        ai_from_row, ai_from_col = SQ_TO_RC[from_square]
+        ai_to_row, ai_to_col = SQ_TO_RC[to_square]
         
         # Make the AI move using FASTEST method (UCI)
-        if chess_match.make_uci_move(ai_move_uci):
-            chess_match.save()  # Sync board
-        
+        chess_match.make_uci_move(ai_move_uci)
+
         # Add AI move to history
         match.add_move({
             'player': 'black',
             'from': [ai_from_row, ai_from_col],
             'to': [ai_to_row, ai_to_col],
             'move_uci': ai_move_uci,
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now_iso
         })
-    
+
+    # One ChessMatch write for the whole turn (human + AI half-moves)
+    chess_match.save(update_fields=['fen', 'move_count', 'white_to_move'])
+
     # Check if game is over after AI move (using FAST method)
     game_result = check_chess_game_result_fast(chess_match, match, request.user)
     if game_result:
         return Response(game_result)
 
+    # Persist both history entries in a single write
+    match.flush_moves()
+
     response_data = {
         'chess_match': ChessMatchSerializer(chess_match).data,
         'is_in_check': {
@@ -356,24 +494,22 @@ def make_chess_move(request, match_id):
 def check_chess_game_result_fast(chess_match, match, user):
     """FAST check if chess game is over using optimized methods"""
     if chess_match.is_game_over_fast():
+        _AI_POOL.pop(match.id, None)  # Game over - release the engine
         match.status = 'completed'
         match.completed_at = timezone.now()
         
         game_result = chess_match.get_game_result_fast()
-        
+
         if game_result == 'white_wins':
             match.result = 'win'
-            user.total_wins += 1
         elif game_result == 'black_wins':
             match.result = 'lose'
-            user.total_losses += 1
         else:  # draw
             match.result = 'draw'
-            user.total_draws += 1
-        
-        user.total_games += 1
-        user.save()
-        match.save()
+
+        _record_result_stats(user, match.result)
+        # moves_history rides along so pending add_move() entries are kept
+        match.save(update_fields=['status', 'completed_at', 'result', 'moves_history'])
         
         return {
             'game_over': True,
@@ -391,20 +527,17 @@ def check_chess_game_result(chess_match, match, user):
         match.completed_at = timezone.now()
         
         game_result = chess_match.get_game_result()
-        
+
         if game_result == 'white_wins':
             match.result = 'win'
-            user.total_wins += 1
         elif game_result == 'black_wins':
             match.result = 'lose'
-            user.total_losses += 1
         else:  # draw
             match.result = 'draw'
-            user.total_draws += 1
-        
-        user.total_games += 1
-        user.save()
-        match.save()
+
+        _record_result_stats(user, match.result)
+        # moves_history rides along so pending add_move() entries are kept
+        match.save(update_fields=['status', 'completed_at', 'result', 'moves_history'])
         
         return {
             'game_over': True,
@@ -419,34 +552,42 @@ def check_chess_game_result(chess_match, match, user):
 @permission_classes([IsAuthenticated])
 def get_chess_legal_moves(request, match_id):
     """Get legal moves for a piece at given position"""
-    match = get_object_or_404(Match, id=match_id, player=request.user)
-    chess_match = get_object_or_404(ChessMatch, match=match)
-    
+    match, chess_match = _fetch_match_pair(request, match_id, 'chessmatch')
+
+    # Nothing is playable out of turn or after the game - skip move
+    # generation entirely for misplaced clicks
+    if match.status != 'in_progress' or not chess_match.white_to_move:
+        return Response({'legal_moves': []})
+
     try:
         row = request.data.get('row')
         col = request.data.get('col')
-        
+
         if row is None or col is None:
             return Response({'error': 'Row and col required'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
         piece = chess_match.get_piece_at(row, col)
         if not piece:
             return Response({'legal_moves': []})
-        
+
         # Check if it's the player's piece
         if not chess_match.is_friendly_piece(piece, 'white'):
             return Response({'legal_moves': []})
-        
-        # Get all legal moves and filter for this piece
-        all_legal_moves = chess_match.get_all_legal_moves('white')
-        piece_moves = []
-        
-        for move in all_legal_moves:
-            from_pos, to_pos = move
-            if from_pos == (row, col):
-                piece_moves.append(list(to_pos))
-        
-        return Response({'legal_moves': piece_moves})
-        
+
+        # Generate moves for this square only (from_mask) instead of
+        # enumerating every legal move and filtering the ~97% that
+        # originate elsewhere; cached per (fen, square) since a position
+        # is often clicked repeatedly while the player deliberates
+        return Response({'legal_moves': _legal_moves_cached(chess_match.fen, row, col)})
+
     except Exception as e:
-        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@lru_cache(maxsize=512)
+def _legal_moves_cached(fen, row, col):
+    """Per-position memo of get_legal_moves_for_square
+
+    A FEN fully determines the legal moves, so entries never go stale;
+    the tuple is returned as-is and serializes like a list
+    """
+    return tuple(ChessMatch(fen=fen).get_legal_moves_for_square(row, col))
\ No newline at end of file
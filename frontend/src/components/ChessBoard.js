@@ -23,7 +23,8 @@ const ChessBoard = ({ board, onMove, disabled = false, currentPlayer, legalMoves
   };
 
   const isSquareHighlighted = (row, col) => {
-    return legalMoves.some(([r, c]) => r === row && c === col);
+    // legalMoves is a flat array of row * 8 + col square indices
+    return legalMoves.includes(row * 8 + col);
   };
 
   const isSquareSelected = (row, col) => {